@@ -2,8 +2,9 @@ from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 import logging
+import time
 
-from .const import DOMAIN, DATA_EXPIRES_AT, DATA_ID_TOKEN
+from .const import DOMAIN, DATA_TOKENS
 from .coordinator import GridXCoordinator
 from .gridx_api import GridXAPI
 
@@ -14,9 +15,7 @@ PLATFORMS: list[Platform] = [Platform.SENSOR]
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up GridX integration from a config entry."""
     # Initialize data storage
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN].setdefault(DATA_EXPIRES_AT, 0)
-    hass.data[DOMAIN].setdefault(DATA_ID_TOKEN, None)
+    domain_data = hass.data.setdefault(DOMAIN, {})
 
     # Create API client
     api = GridXAPI(
@@ -28,8 +27,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry.data["audience"],
     )
 
-    # Authenticate and get gateway ID before creating coordinator
-    await api.authenticate()
+    # Authenticate and get gateway ID before creating coordinator; a token
+    # handed over by the config flow for this account is reused while it is
+    # still valid
+    id_token, expires_at = domain_data.get(DATA_TOKENS, {}).pop(
+        entry.data["username"], (None, 0.0)
+    )
+    if id_token is not None and time.monotonic() < expires_at:
+        api.id_token = id_token
+        api.expires_at = expires_at
+    else:
+        await api.authenticate()
     await api.get_gateway_id()
     _LOGGER.debug("GridX API authenticated, gateway_id: %s", api.gateway_id)
 
@@ -2,12 +2,8 @@
 from typing import Any, Optional
 from datetime import datetime
 from homeassistant.components.sensor import SensorEntity, SensorStateClass, SensorDeviceClass, RestoreSensor
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.helpers.event import async_track_time_change
 from homeassistant.core import callback
-from .const import DOMAIN
-from .helpers import extract_nested_value
 
 
 class GridXCalculatedSensor(CoordinatorEntity, SensorEntity):
@@ -30,18 +26,8 @@ class GridXCalculatedSensor(CoordinatorEntity, SensorEntity):
         self._attr_device_class = device_class
         self._attr_state_class = state_class or SensorStateClass.MEASUREMENT
         
-        # Set device info to group with other GridX sensors
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.api.gateway_id)},
-            name="GridX System",
-            manufacturer="GridX",
-            model="GridX Gateway",
-        )
-
-    @property
-    def available(self) -> bool:
-        """Return if the sensor is available."""
-        return self.coordinator.last_update_success
+        # Share device info to group with other GridX sensors
+        self._attr_device_info = coordinator.device_info
 
 
 class BatteryChargePowerSensor(GridXCalculatedSensor):
@@ -63,7 +49,7 @@ class BatteryChargePowerSensor(GridXCalculatedSensor):
         if self.coordinator.data is None:
             return None
         
-        battery_power = extract_nested_value(self.coordinator.data, "battery.power")
+        battery_power = self.coordinator.live.battery_power
         return battery_power
 
 
@@ -84,24 +70,23 @@ class BatteryEnergyStoredSensor(GridXCalculatedSensor):
     @property
     def native_value(self) -> Optional[float]:
         """Calculate actual energy stored in battery."""
-        if self.coordinator.data is None:
+        coordinator = self.coordinator
+        if coordinator.data is None:
             return None
         
         # Use remainingCharge if available, otherwise calculate from capacity and SOC
-        remaining_charge = extract_nested_value(self.coordinator.data, "battery.remainingCharge")
+        live = coordinator.live
+        remaining_charge = live.battery_remaining_charge
         if remaining_charge is not None:
             return remaining_charge
         
-        capacity = extract_nested_value(self.coordinator.data, "battery.capacity")
-        soc = extract_nested_value(self.coordinator.data, "battery.stateOfCharge")
+        capacity = live.battery_capacity
+        soc = live.battery_state_of_charge
         
         if capacity is None or soc is None:
             return None
         
-        try:
-            return (capacity * soc) / 100
-        except (TypeError, ValueError, ZeroDivisionError):
-            return None
+        return (capacity * soc) / 100
 
 
 class GridExportRateSensor(GridXCalculatedSensor):
@@ -119,11 +104,13 @@ class GridExportRateSensor(GridXCalculatedSensor):
     @property
     def native_value(self) -> Optional[float]:
         """Calculate what percentage of production is exported to grid."""
-        if self.coordinator.data is None:
+        coordinator = self.coordinator
+        if coordinator.data is None:
             return None
         
-        production = extract_nested_value(self.coordinator.data, "production")
-        self_consumption = extract_nested_value(self.coordinator.data, "selfConsumption")
+        live = coordinator.live
+        production = live.production
+        self_consumption = live.self_consumption
         
         if production is None or self_consumption is None:
             return None
@@ -131,42 +118,38 @@ class GridExportRateSensor(GridXCalculatedSensor):
         if production == 0:
             return 0.0
         
-        try:
-            grid_export = production - self_consumption
-            return (grid_export / production) * 100
-        except (TypeError, ValueError, ZeroDivisionError):
-            return None
+        grid_export = production - self_consumption
+        return (grid_export / production) * 100
 
 
 class PeriodEnergySensor(CoordinatorEntity, RestoreSensor):
-    """Base class for period-based energy tracking sensors."""
+    """Period-based energy sensor accumulating one of the coordinator energy flows."""
 
     def __init__(
         self,
         coordinator: Any,
-        name: str,
-        unique_id: str,
+        energy_key: str,
+        name_prefix: str,
         period: str,  # 'daily', 'weekly', 'monthly'
-        device_class: SensorDeviceClass,
     ) -> None:
         """Initialize the period energy sensor."""
         super().__init__(coordinator)
-        self._attr_name = name
-        self._attr_unique_id = unique_id
+        self._attr_name = f"GridX {name_prefix} {period.capitalize()}"
+        self._attr_unique_id = f"gridx_{energy_key}_{period}"
         self._attr_native_unit_of_measurement = "kWh"
-        self._attr_device_class = device_class
+        self._attr_device_class = SensorDeviceClass.ENERGY
         self._attr_state_class = SensorStateClass.TOTAL
+        self._energy_key = energy_key
+        # Sensors are created together with the coordinator, so start from zero
+        # to include the energy of the first refresh done before setup
+        self._last_total = 0.0
+        self._last_available = coordinator.last_update_success
         self._period = period
         self._last_value = 0.0
         self._last_reset = datetime.now()
         self._accumulated = 0.0
         
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.api.gateway_id)},
-            name="GridX System",
-            manufacturer="GridX",
-            model="GridX Gateway",
-        )
+        self._attr_device_info = coordinator.device_info
 
     async def async_added_to_hass(self) -> None:
         """Restore last state."""
@@ -183,39 +166,18 @@ class PeriodEnergySensor(CoordinatorEntity, RestoreSensor):
                 except (ValueError, TypeError):
                     self._last_reset = datetime.now()
         
-        # Schedule periodic reset
-        if self._period == "daily":
-            async_track_time_change(self.hass, self._handle_reset, hour=0, minute=0, second=0)
-        elif self._period == "weekly":
-            # Reset on Monday at midnight
-            async_track_time_change(self.hass, self._handle_reset_weekly, hour=0, minute=0, second=0)
-        elif self._period == "monthly":
-            # Reset on 1st of month at midnight
-            async_track_time_change(self.hass, self._handle_reset_monthly, hour=0, minute=0, second=0)
+        # Resets are dispatched by the coordinator's shared midnight listener
+        self.async_on_remove(
+            self.coordinator.async_add_period_listener(self._period, self._handle_reset)
+        )
 
     @callback
     def _handle_reset(self, now: datetime) -> None:
-        """Reset daily counter."""
+        """Reset the counter at the start of a new period."""
         self._accumulated = 0.0
         self._last_reset = now
         self.async_write_ha_state()
 
-    @callback
-    def _handle_reset_weekly(self, now: datetime) -> None:
-        """Reset weekly counter on Monday."""
-        if now.weekday() == 0:  # Monday
-            self._accumulated = 0.0
-            self._last_reset = now
-            self.async_write_ha_state()
-
-    @callback
-    def _handle_reset_monthly(self, now: datetime) -> None:
-        """Reset monthly counter on 1st of month."""
-        if now.day == 1:
-            self._accumulated = 0.0
-            self._last_reset = now
-            self.async_write_ha_state()
-
     @property
     def native_value(self) -> Optional[float]:
         """Return the accumulated energy."""
@@ -229,156 +191,42 @@ class PeriodEnergySensor(CoordinatorEntity, RestoreSensor):
             "period": self._period,
         }
 
-    @property
-    def available(self) -> bool:
-        """Return if sensor is available."""
-        return self.coordinator.last_update_success
-
-
-class BatteryChargeSensor(PeriodEnergySensor):
-    """Base class for battery charge sensors."""
-
-    def __init__(self, coordinator: Any, period: str) -> None:
-        """Initialize battery charge sensor."""
-        period_name = period.capitalize()
-        super().__init__(
-            coordinator=coordinator,
-            name=f"GridX Battery Charge {period_name}",
-            unique_id=f"gridx_battery_charge_{period}",
-            period=period,
-            device_class=SensorDeviceClass.ENERGY,
-        )
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        if self.coordinator.data is None:
-            return
-        
-        # Get current battery power (positive = charging, negative = discharging)
-        current_power = extract_nested_value(self.coordinator.data, "battery.power") or 0.0
-        
-        # Only accumulate positive power (charging)
-        if current_power > 0:
-            # Convert W to kWh: (power in W * update_interval in seconds) / 3600 / 1000
-            energy_kwh = (current_power * 60) / 3600000  # Assuming 1-minute updates
-            self._accumulated += energy_kwh
-        
-        self.async_write_ha_state()
-
-
-class BatteryDischargeSensor(PeriodEnergySensor):
-    """Base class for battery discharge sensors."""
-
-    def __init__(self, coordinator: Any, period: str) -> None:
-        """Initialize battery discharge sensor."""
-        period_name = period.capitalize()
-        super().__init__(
-            coordinator=coordinator,
-            name=f"GridX Battery Discharge {period_name}",
-            unique_id=f"gridx_battery_discharge_{period}",
-            period=period,
-            device_class=SensorDeviceClass.ENERGY,
-        )
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        if self.coordinator.data is None:
-            return
-        
-        # Get current battery power (positive = charging, negative = discharging)
-        current_power = extract_nested_value(self.coordinator.data, "battery.power") or 0.0
-        
-        # Only accumulate negative power (discharging), convert to positive
-        if current_power < 0:
-            energy_kwh = (abs(current_power) * 60) / 3600000  # Assuming 1-minute updates
-            self._accumulated += energy_kwh
-        
-        self.async_write_ha_state()
-
-
-class GridImportSensor(PeriodEnergySensor):
-    """Base class for grid import sensors."""
-
-    def __init__(self, coordinator: Any, period: str) -> None:
-        """Initialize grid import sensor."""
-        period_name = period.capitalize()
-        super().__init__(
-            coordinator=coordinator,
-            name=f"GridX Grid Import {period_name}",
-            unique_id=f"gridx_grid_import_{period}",
-            period=period,
-            device_class=SensorDeviceClass.ENERGY,
-        )
-
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if self.coordinator.data is None:
+        coordinator = self.coordinator
+        if coordinator.data is None:
             return
         
-        # Get grid power (positive = import, negative = export)
-        grid_power = extract_nested_value(self.coordinator.data, "grid") or 0.0
-        
-        # Only accumulate positive power (importing from grid)
-        if grid_power > 0:
-            energy_kwh = (grid_power * 60) / 3600000  # Assuming 1-minute updates
-            self._accumulated += energy_kwh
-        
-        self.async_write_ha_state()
-
-
-class GridExportSensor(PeriodEnergySensor):
-    """Base class for grid export sensors."""
-
-    def __init__(self, coordinator: Any, period: str) -> None:
-        """Initialize grid export sensor."""
-        period_name = period.capitalize()
-        super().__init__(
-            coordinator=coordinator,
-            name=f"GridX Grid Export {period_name}",
-            unique_id=f"gridx_grid_export_{period}",
-            period=period,
-            device_class=SensorDeviceClass.ENERGY,
-        )
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        if self.coordinator.data is None:
+        # Add the energy the coordinator integrated since our last update
+        total = coordinator.energy_totals[self._energy_key]
+        available = coordinator.last_update_success
+        if total == self._last_total and available == self._last_available:
+            # Nothing accumulated (e.g. battery not charging): skip the state write
             return
         
-        # Calculate export: production - self consumption
-        production = extract_nested_value(self.coordinator.data, "production") or 0.0
-        self_consumption = extract_nested_value(self.coordinator.data, "selfConsumption") or 0.0
-        grid_export = max(0, production - self_consumption)
-        
-        if grid_export > 0:
-            energy_kwh = (grid_export * 60) / 3600000  # Assuming 1-minute updates
-            self._accumulated += energy_kwh
+        self._accumulated += total - self._last_total
+        self._last_total = total
+        self._last_available = available
         
         self.async_write_ha_state()
 
 
-# List of all calculated sensor classes
+# List of calculated sensor classes taking only the coordinator
 CALCULATED_SENSOR_CLASSES = [
     BatteryChargePowerSensor,
     BatteryEnergyStoredSensor,
     GridExportRateSensor,
-    # Daily sensors
-    lambda coord: BatteryChargeSensor(coord, "daily"),
-    lambda coord: BatteryDischargeSensor(coord, "daily"),
-    lambda coord: GridImportSensor(coord, "daily"),
-    lambda coord: GridExportSensor(coord, "daily"),
-    # Weekly sensors
-    lambda coord: BatteryChargeSensor(coord, "weekly"),
-    lambda coord: BatteryDischargeSensor(coord, "weekly"),
-    lambda coord: GridImportSensor(coord, "weekly"),
-    lambda coord: GridExportSensor(coord, "weekly"),
-    # Monthly sensors
-    lambda coord: BatteryChargeSensor(coord, "monthly"),
-    lambda coord: BatteryDischargeSensor(coord, "monthly"),
-    lambda coord: GridImportSensor(coord, "monthly"),
-    lambda coord: GridExportSensor(coord, "monthly"),
+]
+
+# Period energy sensors as (energy flow key, name prefix, period)
+PERIOD_ENERGY_SENSORS = [
+    (energy_key, name_prefix, period)
+    for period in ("daily", "weekly", "monthly")
+    for energy_key, name_prefix in (
+        ("battery_charge", "Battery Charge"),
+        ("battery_discharge", "Battery Discharge"),
+        ("grid_import", "Grid Import"),
+        ("grid_export", "Grid Export"),
+    )
 ]
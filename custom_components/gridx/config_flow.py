@@ -1,7 +1,7 @@
 from homeassistant import config_entries
 import voluptuous as vol
 import logging
-from .const import DOMAIN, CONF_CLIENT_ID, CONF_REALM, CONF_AUDIENCE
+from .const import DOMAIN, CONF_CLIENT_ID, CONF_REALM, CONF_AUDIENCE, DATA_TOKENS
 from .gridx_api import GridXAPI
 
 _LOGGER = logging.getLogger(__name__)
@@ -18,7 +18,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             # Validate credentials by attempting authentication
             try:
                 api = GridXAPI(
-                    None,  # hass not needed for validation
+                    self.hass,
                     user_input["username"],
                     user_input["password"],
                     user_input["client_id"],
@@ -27,6 +27,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 )
                 # Test authentication
                 await api.authenticate()
+                # Hand the token over so this account's entry setup can reuse it
+                tokens = self.hass.data.setdefault(DOMAIN, {}).setdefault(DATA_TOKENS, {})
+                tokens[api.username] = (api.id_token, api.expires_at)
                 return self.async_create_entry(title="GridX-Box Data Collector", data=user_input)
             except Exception as err:
                 _LOGGER.error("Authentication failed: %s", err)
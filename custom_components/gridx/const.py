@@ -10,9 +10,13 @@ LIVE_URL = "https://api.gridx.de/systems/{}/live"
 
 GRANT_TYPE = "http://auth0.com/oauth/grant-type/password-realm"
 
+# Polling interval for the /live endpoint (seconds). All sensors, including
+# slow-moving values like battery capacity, come from this single payload.
+UPDATE_INTERVAL = 60
+
 # Token expiration offset (seconds before actual expiration to refresh)
 TOKEN_EXPIRATION_OFFSET = 52200
 
-# Data storage keys
-DATA_EXPIRES_AT = "expires_at"
-DATA_ID_TOKEN = "id_token"
+# hass.data key for handing config flow tokens over to entry setup,
+# stored as {username: (id_token, expires_at)}
+DATA_TOKENS = "tokens"
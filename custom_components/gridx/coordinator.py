@@ -1,15 +1,85 @@
 """DataUpdateCoordinator for GridX integration."""
-from datetime import timedelta
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 import logging
+import time
+from typing import Any, Callable
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_track_time_change
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN
+from .const import DOMAIN, UPDATE_INTERVAL
 from .gridx_api import GridXAPI
+from .helpers import finite_number
 
 _LOGGER = logging.getLogger(__name__)
 
+# Conversion factor from watt-seconds to kWh
+_W_S_TO_KWH = 1.0 / 3600000
+
+# Longest interval (seconds) integrated from a single reading. After an outage
+# the first reading says nothing about the power during the gap, so booking the
+# whole gap at that power could add many kWh to the TOTAL sensors; a gap is
+# counted as at most a few poll periods instead (under-counting, like before).
+_MAX_INTEGRATION_INTERVAL = 3 * UPDATE_INTERVAL
+
+# Energy flows integrated by the coordinator, keyed as used by the period sensors
+ENERGY_FLOWS = ("battery_charge", "battery_discharge", "grid_import", "grid_export")
+
+
+@dataclass(slots=True)
+class GridXLive:
+    """Values of the /live payload used by the calculated sensors."""
+
+    battery_power: float | None = None
+    battery_capacity: float | None = None
+    battery_state_of_charge: float | None = None
+    battery_remaining_charge: float | None = None
+    production: float | None = None
+    self_consumption: float | None = None
+    grid: float | None = None
+
+    @classmethod
+    def from_data(cls, data: Any) -> "GridXLive":
+        """Pick the used values out of a /live payload.
+
+        Anything that is not a finite number (missing, NaN, inf, strings) becomes
+        None here, so the sensors only need to check for None.
+        """
+        if not isinstance(data, dict):
+            return cls()
+        battery = data.get("battery")
+        if not isinstance(battery, dict):
+            battery = {}
+        return cls(
+            battery_power=finite_number(battery.get("power")),
+            battery_capacity=finite_number(battery.get("capacity")),
+            battery_state_of_charge=finite_number(battery.get("stateOfCharge")),
+            battery_remaining_charge=finite_number(battery.get("remainingCharge")),
+            production=finite_number(data.get("production")),
+            self_consumption=finite_number(data.get("selfConsumption")),
+            grid=finite_number(data.get("grid")),
+        )
+
+
+def _power_flows(live: GridXLive) -> dict[str, float]:
+    """Split the live power readings into non-negative flows in W."""
+    battery_power = live.battery_power or 0.0
+    grid_power = live.grid or 0.0
+    production = live.production or 0.0
+    self_consumption = live.self_consumption or 0.0
+    return {
+        # Battery power: positive = charging, negative = discharging
+        "battery_charge": max(0.0, battery_power),
+        "battery_discharge": max(0.0, -battery_power),
+        # Grid power: positive = import
+        "grid_import": max(0.0, grid_power),
+        # Export: production not consumed on site
+        "grid_export": max(0.0, production - self_consumption),
+    }
+
 
 class GridXCoordinator(DataUpdateCoordinator):
     """GridX data update coordinator."""
@@ -20,30 +90,108 @@ class GridXCoordinator(DataUpdateCoordinator):
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(minutes=1),
+            update_interval=timedelta(seconds=UPDATE_INTERVAL),
+            # Only notify entities when the payload differs from the previous
+            # poll. Any new measurement changes the payload, so this mainly
+            # saves writes when the gateway has not reported since the last
+            # poll. Energy integration does not depend on these notifications:
+            # it runs on every poll and period sensors catch up from
+            # energy_totals.
+            always_update=False,
         )
         self.api = api
+        # Shared by all entities; gateway_id is known before the coordinator
+        # is created
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, api.gateway_id)},
+            name="GridX System",
+            manufacturer="GridX",
+            model="GridX Gateway",
+        )
+        # Values used by the calculated sensors, parsed once per refresh
+        self.live = GridXLive()
+        # Running energy totals (kWh) since this coordinator was created; period
+        # sensors add the difference between two updates, so skipped
+        # notifications are not lost
+        self.energy_totals: dict[str, float] = dict.fromkeys(ENERGY_FLOWS, 0.0)
+        self._last_poll: float | None = None
+        # Reset callbacks of the period sensors, fired by one shared midnight listener
+        self._period_listeners: dict[str, list[Callable[[datetime], None]]] = {
+            "daily": [],
+            "weekly": [],
+            "monthly": [],
+        }
+        self._unsub_midnight: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add_period_listener(
+        self, period: str, reset: Callable[[datetime], None]
+    ) -> CALLBACK_TYPE:
+        """Register a reset callback for a period; returns a function to remove it."""
+        listeners = self._period_listeners[period]
+        listeners.append(reset)
+        if self._unsub_midnight is None:
+            self._unsub_midnight = async_track_time_change(
+                self.hass, self._handle_midnight, hour=0, minute=0, second=0
+            )
+
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(reset)
+            if self._unsub_midnight is not None and not any(self._period_listeners.values()):
+                self._unsub_midnight()
+                self._unsub_midnight = None
+
+        return remove_listener
+
+    @callback
+    def _handle_midnight(self, now: datetime) -> None:
+        """Reset daily sensors, weekly ones on Monday and monthly ones on the 1st."""
+        periods = ["daily"]
+        if now.weekday() == 0:  # Monday
+            periods.append("weekly")
+        if now.day == 1:
+            periods.append("monthly")
+        for period in periods:
+            for reset in list(self._period_listeners[period]):
+                reset(now)
+
+    def _integrate_energy(self, live: GridXLive) -> None:
+        """Add the energy of each flow since the previous successful poll."""
+        now = time.monotonic()
+        last_poll, self._last_poll = self._last_poll, now
+        if last_poll is None:
+            # First poll: count one regular interval, as the fixed 60 s did
+            elapsed = UPDATE_INTERVAL
+        else:
+            # Real elapsed time, so slightly delayed polls are not under-counted,
+            # capped so an outage is not booked at the first reading after it
+            elapsed = min(now - last_poll, _MAX_INTEGRATION_INTERVAL)
+        factor = elapsed * _W_S_TO_KWH
+        totals = self.energy_totals
+        for key, power in _power_flows(live).items():
+            totals[key] += power * factor
 
     async def _async_update_data(self):
         """Fetch data from API."""
         try:
             _LOGGER.debug("GridXCoordinator fetching live data")
             data = await self.api.get_live_data()
-            _LOGGER.debug("GridXCoordinator received data keys: %s", list(data.keys()) if isinstance(data, dict) else type(data))
-
-            if isinstance(data, dict):
-                raw_rate = data.get("selfSufficiencyRate")
-                raw_self_consumption = data.get("selfConsumption")
-                raw_production = data.get("production")
-                raw_consumption = data.get("consumption")
-                _LOGGER.debug(
-                    "GridXCoordinator raw values: selfSufficiencyRate=%r selfConsumption=%r production=%r consumption=%r",
-                    raw_rate,
-                    raw_self_consumption,
-                    raw_production,
-                    raw_consumption,
-                )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("GridXCoordinator received data keys: %s", list(data.keys()) if isinstance(data, dict) else type(data))
+
+                if isinstance(data, dict):
+                    _LOGGER.debug(
+                        "GridXCoordinator raw values: selfSufficiencyRate=%r selfConsumption=%r production=%r consumption=%r",
+                        data.get("selfSufficiencyRate"),
+                        data.get("selfConsumption"),
+                        data.get("production"),
+                        data.get("consumption"),
+                    )
 
+            live = GridXLive.from_data(data)
+            self._integrate_energy(live)
+            self.live = live
             return data
         except Exception as err:
             raise UpdateFailed(f"Error communicating with API: {err}")
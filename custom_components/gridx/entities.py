@@ -1,8 +1,7 @@
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from .const import DOMAIN
 from typing import Any, Optional
+from .helpers import extract_nested_value, finite_number
 
 
 class GridXSensor(CoordinatorEntity, SensorEntity):
@@ -12,18 +11,14 @@ class GridXSensor(CoordinatorEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._key = key
-        self._unique_id = unique_id
-        self._device_class = device_class
+        self._is_rate = key.lower().replace("_", "").endswith("rate")
+        self._attr_unique_id = unique_id
+        self._attr_device_class = device_class
         self._attr_native_unit_of_measurement = unit
         self._attr_name = name  # For entity registry support and user renaming
         
-        # Set device info once with the gateway_id from coordinator
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.api.gateway_id)},
-            name="GridX API Connector",
-            manufacturer="Markus Schultheis (c) 2024-2025",
-            model="GridX-Box Data Collector",
-        )
+        # Device info is shared by all sensors via the coordinator
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> Optional[float]:
@@ -33,41 +28,13 @@ class GridXSensor(CoordinatorEntity, SensorEntity):
         value = self.extract_value(self.coordinator.data)
         return value
 
-    @property
-    def unique_id(self) -> str:
-        """Return the unique ID of the sensor."""
-        return self._unique_id
-
-    @property
-    def device_class(self) -> Optional[SensorDeviceClass]:
-        """Return the device class."""
-        return self._device_class
-
-    @property
-    def available(self) -> bool:
-        """Return if the sensor is available."""
-        return self.coordinator.last_update_success
-
     def extract_value(self, data: Any) -> Any:
         """Extract the desired value from the API response."""
-        keys = self._key.split(".")
-        value = data
-        for key in keys:
-            if isinstance(value, dict):
-                value = value.get(key)
-            elif isinstance(value, list) and key.isdigit():
-                idx = int(key)
-                if 0 <= idx < len(value):
-                    value = value[idx]
-                else:
-                    return None
-            else:
-                return None
+        # Non-finite or non-numeric readings are reported as unknown
+        value = finite_number(extract_nested_value(data, self._key))
 
         # Normalize rate fields (API may send either 0..1 or 0..100)
-        if isinstance(value, (int, float)):
-            key_lower = self._key.lower().replace("_", "")
-            if key_lower.endswith("rate") and 0.0 <= value <= 1.0:
-                return value * 100
+        if self._is_rate and value is not None and 0.0 <= value <= 1.0:
+            return value * 100
 
         return value
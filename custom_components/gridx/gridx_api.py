@@ -1,14 +1,13 @@
 import aiohttp
 import logging
 import time
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
 from .const import (
     AUTH_URL,
     GATEWAYS_URL,
     LIVE_URL,
     GRANT_TYPE,
-    DOMAIN,
-    DATA_ID_TOKEN,
-    DATA_EXPIRES_AT,
     TOKEN_EXPIRATION_OFFSET,
 )
 
@@ -27,7 +26,9 @@ class GridXAPI:
         self.audience = audience
         self.gateway_id = None
         self.id_token = None
-                
+        # time.monotonic() deadline after which the token is refreshed
+        self.expires_at = 0.0
+
     async def authenticate(self):
         """Authenticate and obtain access token."""
         payload = {
@@ -41,14 +42,12 @@ class GridXAPI:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(AUTH_URL, json=payload) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-                    self.id_token = data.get("id_token")
-                    if self.hass:
-                        self.hass.data[DOMAIN][DATA_ID_TOKEN] = self.id_token
-                        self.hass.data[DOMAIN][DATA_EXPIRES_AT] = data.get("expires_in") + time.time() - TOKEN_EXPIRATION_OFFSET
+            session = async_get_clientsession(self.hass)
+            async with session.post(AUTH_URL, json=payload) as response:
+                response.raise_for_status()
+                data = await response.json(loads=json_loads)
+                self.id_token = data.get("id_token")
+                self.expires_at = time.monotonic() + data.get("expires_in") - TOKEN_EXPIRATION_OFFSET
         except aiohttp.ClientError as err:
             _LOGGER.error("Authentication request failed: %s", err)
             raise
@@ -60,11 +59,11 @@ class GridXAPI:
         """Retrieve the gateway ID from the API."""
         headers = {"Authorization": f"Bearer {self.id_token}"}
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(GATEWAYS_URL, headers=headers) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-                    self.gateway_id = data[0]["system"]["id"]
+            session = async_get_clientsession(self.hass)
+            async with session.get(GATEWAYS_URL, headers=headers) as response:
+                response.raise_for_status()
+                data = await response.json(loads=json_loads)
+                self.gateway_id = data[0]["system"]["id"]
         except aiohttp.ClientError as err:
             _LOGGER.error("Failed to retrieve gateway ID: %s", err)
             raise
@@ -74,8 +73,6 @@ class GridXAPI:
 
     async def get_live_data(self):
         """Retrieve live data from the GridX API."""
-        now = time.time()
-
         # Ensure we have a token and gateway id
         if self.id_token is None:
             await self.authenticate()
@@ -88,16 +85,16 @@ class GridXAPI:
         if self.gateway_id is None:
             raise RuntimeError("Failed to obtain gateway ID")
 
-        if now > self.hass.data[DOMAIN][DATA_EXPIRES_AT]:
+        if time.monotonic() > self.expires_at:
             _LOGGER.info("Token expired, re-authenticating")
             await self.authenticate()
 
         headers = {"Authorization": f"Bearer {self.id_token}"}
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(LIVE_URL.format(self.gateway_id), headers=headers) as response:
-                    response.raise_for_status()
-                    return await response.json()
+            session = async_get_clientsession(self.hass)
+            async with session.get(LIVE_URL.format(self.gateway_id), headers=headers) as response:
+                response.raise_for_status()
+                return await response.json(loads=json_loads)
         except aiohttp.ClientError as err:
             _LOGGER.error("Failed to retrieve live data: %s", err)
             raise
@@ -1,6 +1,29 @@
 """Helpers used by the GridX integration."""
 
-from typing import Any, Dict
+from functools import lru_cache
+from math import isfinite
+from typing import Any, Dict, Optional, Tuple
+
+
+@lru_cache(maxsize=512)
+def _parse_key_path(
+    key_path: str,
+) -> Tuple[Tuple[Tuple[str, Optional[int]], ...], bool]:
+    """
+    Split a dotted key path into (key, list index or None) segments, once per path.
+
+    Returns the segments and whether any of them can be a list index.
+    """
+    segments = tuple((key, int(key) if key.isdigit() else None) for key in key_path.split("."))
+    return segments, any(idx is not None for _, idx in segments)
+
+
+def finite_number(value: Any) -> Optional[float]:
+    """Return value if it is a finite int or float (not bool), otherwise None."""
+    t = type(value)
+    if t is int or (t is float and isfinite(value)):
+        return value
+    return None
 
 
 def extract_nested_value(data: Dict[str, Any], key_path: str) -> Any:
@@ -18,14 +41,21 @@ def extract_nested_value(data: Dict[str, Any], key_path: str) -> Any:
     if not data or not key_path:
         return None
         
-    keys = key_path.split(".")
     value = data
+    segments, has_index = _parse_key_path(key_path)
+
+    if not has_index:
+        # Plain dotted path (the common case): only dicts can be walked
+        for key, _ in segments:
+            if type(value) is not dict:
+                return None
+            value = value.get(key)
+        return value
     
-    for key in keys:
+    for key, idx in segments:
         if isinstance(value, dict):
             value = value.get(key)
-        elif isinstance(value, list) and key.isdigit():
-            idx = int(key)
+        elif idx is not None and isinstance(value, list):
             if 0 <= idx < len(value):
                 value = value[idx]
             else:
@@ -34,3 +64,31 @@ def extract_nested_value(data: Dict[str, Any], key_path: str) -> Any:
             return None
             
     return value
+
+
+def flatten_dict(d, prefix=""):
+    """Flatten a nested dict into a list of (key_path, value) tuples for numeric values."""
+    items = []
+    # Explicit stack of (path components, item iterator) keeps the original key
+    # order without recursion; the dotted key is only joined for numeric leaves
+    stack = [((prefix,) if prefix else (), iter(d.items()))]
+    while stack:
+        path, it = stack[-1]
+        for k, v in it:
+            # Values come from JSON, so exact type checks suffice; this also
+            # keeps booleans (an int subclass) from becoming numeric sensors
+            t = type(v)
+            if t is dict:
+                stack.append((path + (k,), iter(v.items())))
+                break
+            elif t is list:
+                # Handle lists: if list of dicts, take the first item; if list of numbers, skip for now
+                if v and type(v[0]) is dict:
+                    stack.append((path + (k, "0"), iter(v[0].items())))
+                    break
+            elif t is int or (t is float and isfinite(v)):
+                # NaN/inf readings never become sensors
+                items.append((".".join(path + (k,)), v))
+        else:
+            stack.pop()
+    return items
@@ -1,18 +1,22 @@
+from functools import lru_cache
 import logging
+import string
+import sys
 
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .calculated_sensors import CALCULATED_SENSOR_CLASSES
+from .calculated_sensors import CALCULATED_SENSOR_CLASSES, PERIOD_ENERGY_SENSORS, PeriodEnergySensor
 from .const import DOMAIN
 from .entities import GridXSensor
+from .helpers import flatten_dict
 
 _LOGGER = logging.getLogger(__name__)
 
 
-POWER_KEYS = {
+POWER_KEYS = frozenset({
     # Top-level instantaneous power flow keys (as observed from /live payload)
     "battery",
     "consumption",
@@ -28,48 +32,51 @@ POWER_KEYS = {
     "selfconsumption",
     "selfsupply",
     "totalconsumption",
-}
+})
 
 
-def classify_key(key: str):
-    """Infer unit + device class for a flattened key."""
-    key_lower = key.lower().replace("_", "")
+# Lowercase ASCII letters and drop underscores in a single pass (API keys are ASCII)
+_NORMALIZE_KEY = str.maketrans(
+    {**{c: c.lower() for c in string.ascii_uppercase}, "_": None}
+)
 
+# Substring rules checked in order after the exact POWER_KEYS match; none of
+# the POWER_KEYS contains one of these needles, so the exact check can go first
+_CLASSIFY_RULES = (
     # Explicit percentages
-    if "rate" in key_lower or "efficiency" in key_lower or "stateofcharge" in key_lower:
-        return "%", None
-
+    ("rate", ("%", None)),
+    ("efficiency", ("%", None)),
+    ("stateofcharge", ("%", None)),
     # Explicit power
-    if "power" in key_lower:
-        return "W", SensorDeviceClass.POWER
+    ("power", ("W", SensorDeviceClass.POWER)),
+    # Explicit energy / readings
+    ("meterreading", ("Wh", SensorDeviceClass.ENERGY)),
+    ("remainingcharge", ("Wh", SensorDeviceClass.ENERGY_STORAGE)),
+    ("capacity", ("Wh", SensorDeviceClass.ENERGY_STORAGE)),
+)
+
+
+@lru_cache(maxsize=512)
+def classify_key(key: str):
+    """Infer unit + device class for a flattened key."""
+    key_lower = key.translate(_NORMALIZE_KEY)
 
     if key_lower in POWER_KEYS:
         return "W", SensorDeviceClass.POWER
 
-    # Explicit energy / readings
-    if "meterreading" in key_lower:
-        return "Wh", SensorDeviceClass.ENERGY
-
-    if "remainingcharge" in key_lower or "capacity" in key_lower:
-        return "Wh", SensorDeviceClass.ENERGY_STORAGE
+    for needle, result in _CLASSIFY_RULES:
+        if needle in key_lower:
+            return result
 
     return None, None
 
 
-def flatten_dict(d, prefix=""):
-    """Flatten a nested dict into a list of (key_path, value) tuples for numeric values."""
-    items = []
-    for k, v in d.items():
-        new_key = f"{prefix}.{k}" if prefix else k
-        if isinstance(v, dict):
-            items.extend(flatten_dict(v, new_key))
-        elif isinstance(v, list):
-            # Handle lists: if list of dicts, take the first item; if list of numbers, skip for now
-            if v and isinstance(v[0], dict):
-                items.extend(flatten_dict(v[0], f"{new_key}.0"))
-        elif isinstance(v, (int, float)):
-            items.append((new_key, v))
-    return items
+@lru_cache(maxsize=512)
+def derive_names(key: str):
+    """Return (name, unique_id) for a flattened key."""
+    name = sys.intern(key.replace(".", " ").title())
+    unique_id = sys.intern("gridx_" + key.replace(".", "_"))
+    return name, unique_id
 
 
 async def async_setup_entry(
@@ -91,39 +98,47 @@ async def async_setup_entry(
         flattened = flatten_dict(data)
         if not flattened:
             _LOGGER.warning("No numeric values found in API response to create sensors")
-        _LOGGER.debug("Flattened keys from API: %s", [k for k, _ in flattened])
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug("Flattened keys from API: %s", [k for k, _ in flattened])
+        append = sensors.append
         for key, _ in flattened:
-            # Generate name from key
-            name = key.replace(".", " ").title()
+            # Dotted paths are not interned automatically; the key is compared
+            # and hashed for every lookup over the sensor's lifetime
+            key = sys.intern(key)
+
+            # Generate name and unique ID from key
+            name, unique_id = derive_names(key)
 
             # Determine unit and device_class
             unit, device_class = classify_key(key)
 
-            # Generate unique ID
-            unique_id = f"gridx_{key.replace('.', '_')}"
-
-            _LOGGER.debug(
-                "Creating sensor - key: %s, name: %s, unit: %s, device_class: %s",
-                key,
-                name,
-                unit,
-                device_class,
-            )
-            sensors.append(GridXSensor(coordinator, name, unit, key, unique_id, device_class))
+            if debug:
+                _LOGGER.debug(
+                    "Creating sensor - key: %s, name: %s, unit: %s, device_class: %s",
+                    key,
+                    name,
+                    unit,
+                    device_class,
+                )
+            append(GridXSensor(coordinator, name, unit, key, unique_id, device_class))
 
         _LOGGER.info("Created %d regular sensors", len(sensors))
 
-        # Add calculated sensors
-        for sensor_class in CALCULATED_SENSOR_CLASSES:
-            try:
-                sensors.append(sensor_class(coordinator))
-            except Exception as err:
-                sensor_name = getattr(sensor_class, '__name__', str(sensor_class))
-                _LOGGER.warning("Failed to create calculated sensor %s: %s", sensor_name, err)
+        # Add calculated sensors; the class list is static, so a failure here
+        # is unexpected and does not need per-sensor isolation
+        try:
+            sensors.extend(sensor_class(coordinator) for sensor_class in CALCULATED_SENSOR_CLASSES)
+            sensors.extend(
+                PeriodEnergySensor(coordinator, energy_key, name_prefix, period)
+                for energy_key, name_prefix, period in PERIOD_ENERGY_SENSORS
+            )
+        except Exception as err:
+            _LOGGER.warning("Failed to create calculated sensors: %s", err)
 
         _LOGGER.info("Total sensors created: %d", len(sensors))
 
-        async_add_entities(sensors, update_before_add=True)
+        async_add_entities(sensors, update_before_add=False)
     except Exception as err:
         _LOGGER.error("Failed to setup GridX sensors: %s", err)
         raise